@@ -0,0 +1,246 @@
+import asyncio
+import json
+import logging
+import pathlib
+import time
+from contextlib import suppress
+
+from bleak import BleakScanner, BleakClient
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+from bleak.exc import BleakError
+
+logger = logging.getLogger(__name__)
+
+# UUID Constants
+SERVICE_UUID = "4fbfc1d7-f509-44ab-afe1-62ea40a4b111"
+CHARACTERISTIC_UUID = "dc3f5274-33ba-48de-8246-43bf8985b323"
+
+# Last device address and characteristic handle, to skip scanning on launch
+CACHE_FILE = pathlib.Path.home() / ".cache" / "droidpad-ble.json"
+
+_STOP = object()
+
+
+def parse_csv(data: bytes | bytearray) -> dict:
+    """Parse a DroidPad CSV notification into the same event the JSON servers receive."""
+    id, type, *values = data.decode().strip().split(",")
+    match (type, values):
+        case ("SWITCH", [state]):
+            return {"id": id, "type": type, "state": state.lower() == "true"}
+        case ("BUTTON", [state]):
+            return {"id": id, "type": type, "state": state}
+        case ("DPAD", [button, state]):
+            return {"id": id, "type": type, "button": button, "state": state}
+        case ("JOYSTICK", [x, y]):
+            return {"id": id, "type": type, "x": float(x), "y": float(y)}
+        case ("SLIDER", [value]):
+            return {"id": id, "type": type, "value": float(value)}
+        case _:
+            return {"id": id, "type": type, "values": values}
+
+
+def detection_callback(device: BLEDevice, advertisement_data: AdvertisementData):
+    """Callback for device detection during scanning."""
+    logger.debug(f"Detected device: {device.name} ({device.address})")
+    return SERVICE_UUID in (str(uuid).lower() for uuid in advertisement_data.service_uuids)
+
+
+class BLESubscriber:
+    """
+    Keeps a subscription to DroidPad notifications alive and yields parsed events.
+
+    Usage:
+        async with BLESubscriber() as subscriber:
+            async for event in subscriber:
+                ...
+
+    The last device is connected directly, with a short `direct_timeout` since
+    Android rotates its BLE address, falling back to a scan, and the link
+    is re-established with exponential backoff when lost. When the consumer is
+    slower than the pad, the oldest events are dropped and counted in `dropped`.
+    `scanner` and `client_class` can be replaced to run without a real adapter.
+    """
+
+    def __init__(self, cache_file: pathlib.Path | None = CACHE_FILE,
+                 queue_size: int = 64, scan_timeout: float = 5.0,
+                 connect_timeout: float = 5.0, direct_timeout: float = 1.5,
+                 backoff: tuple[float, float] = (0.5, 8.0),
+                 scanner=BleakScanner, client_class=BleakClient):
+        self.cache_file = cache_file
+        self.scan_timeout = scan_timeout
+        self.connect_timeout = connect_timeout
+        self.direct_timeout = direct_timeout
+        self.backoff = backoff
+        self.scanner = scanner
+        self.client_class = client_class
+
+        self.queue: asyncio.Queue = asyncio.Queue(queue_size)
+        self.dropped = 0
+        self.malformed = 0
+        self.first_event_times: list[tuple[str, float]] = []
+
+        self._cache = self._load_cache()
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._since: float | None = None
+        self._phase = "startup"
+
+    async def __aenter__(self):
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.create_task(self._run())
+        self._task.add_done_callback(lambda _: self._push_stop())
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self._task:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> dict:
+        event = await self.queue.get()
+        if event is _STOP:
+            self._push_stop()  # keep later calls from blocking
+            if self._task and not self._task.cancelled() and self._task.exception():
+                raise self._task.exception()  # type: ignore
+            raise StopAsyncIteration
+        return event
+
+    async def _run(self):
+        self._since = time.perf_counter()
+        delay = self.backoff[0]
+        while True:
+            try:
+                await self._session()
+                delay = self.backoff[0]
+                continue
+            except (BleakError, OSError, asyncio.TimeoutError) as e:
+                logger.warning(f"Connection failed: {e}")
+
+            logger.info(f"Retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.backoff[1])
+
+    async def _session(self):
+        disconnected = asyncio.Event()
+
+        def on_disconnect(_):
+            # time to first event after a reconnect counts from the link loss,
+            # unless the clock is still running since an earlier one
+            if self._since is None:
+                self._since = time.perf_counter()
+                self._phase = "reconnect"
+            disconnected.set()
+
+        client = await self._connect(on_disconnect)
+        try:
+            characteristic = self._characteristic(client)
+            await client.start_notify(characteristic, self._on_notify)
+            logger.info(f"Listening for notifications from {client.address}")
+            await disconnected.wait()
+            logger.warning(f"Link to {client.address} lost, reconnecting...")
+        finally:
+            with suppress(BleakError, OSError, asyncio.TimeoutError):
+                await client.disconnect()
+
+    async def _connect(self, disconnected_callback):
+        if address := self._cache.get("address"):
+            logger.info(f"Connecting to last device: {address}")
+            client = self.client_class(
+                address, disconnected_callback=disconnected_callback, timeout=self.direct_timeout,
+                winrt={"use_cached_services": True})
+            try:
+                await client.connect()
+                return client
+            except (BleakError, OSError, asyncio.TimeoutError) as e:
+                logger.info(f"Last device unreachable ({e}), scanning...")
+
+        logger.info("Scanning for BLE devices...")
+        device = await self.scanner.find_device_by_filter(
+            detection_callback, timeout=self.scan_timeout)
+        if not device:
+            raise BleakError(f"No device found with service UUID: {SERVICE_UUID}")
+        if address and device.address != address:
+            # the pad rotated its address, stop trying the old one
+            self._save_cache({})
+
+        logger.info(f"Connecting to device: {device.name} ({device.address})")
+        client = self.client_class(
+            device, disconnected_callback=disconnected_callback, timeout=self.connect_timeout,
+            winrt={"use_cached_services": False})
+        await client.connect()
+        return client
+
+    def _characteristic(self, client):
+        # the cached handle is only trusted if it still points to our characteristic
+        handle = self._cache.get("handle")
+        characteristic = None
+        if client.address == self._cache.get("address") and isinstance(handle, int):
+            characteristic = client.services.get_characteristic(handle)
+        if not characteristic or characteristic.uuid.lower() != CHARACTERISTIC_UUID:
+            characteristic = client.services.get_characteristic(CHARACTERISTIC_UUID)
+
+        if not characteristic:
+            # services may be stale, next attempt will scan with a fresh cache
+            self._save_cache({})
+            raise BleakError(f"Characteristic {CHARACTERISTIC_UUID} not found")
+
+        self._save_cache({"address": client.address, "handle": characteristic.handle})
+        return characteristic
+
+    def _on_notify(self, sender, data: bytearray):
+        try:
+            event = parse_csv(data)
+        except (ValueError, UnicodeDecodeError):
+            self.malformed += 1
+            return
+
+        if self._since is not None:
+            elapsed = time.perf_counter() - self._since
+            self._since = None
+            self.first_event_times.append((self._phase, elapsed))
+            self._loop.call_soon(self._report_first_event, self._phase, elapsed)  # type: ignore
+
+        self._push(event)
+
+    def _push(self, item):
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(item)
+
+    def _push_stop(self):
+        # make room without counting it, the evicted event is not a drop by the pad
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(_STOP)
+
+    def _report_first_event(self, phase: str, elapsed: float):
+        logger.info(f"Time to first event ({phase}): {elapsed * 1000:.0f}ms")
+
+    def _load_cache(self) -> dict:
+        if not self.cache_file:
+            return {}
+        try:
+            with open(self.cache_file, "rb") as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, cache: dict):
+        if cache == self._cache:
+            return
+        self._cache = cache
+        if not self.cache_file:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, "w") as f:
+                json.dump(cache, f)
+        except OSError as e:
+            logger.warning(f"Could not save device cache: {e}")
@@ -0,0 +1,99 @@
+import asyncio
+
+from bleak.exc import BleakError
+
+from ble_subscriber import SERVICE_UUID, CHARACTERISTIC_UUID
+
+
+class FakeDevice:
+    def __init__(self, address: str, name: str = "DroidPad"):
+        self.address = address
+        self.name = name
+
+
+class FakeAdvertisementData:
+    def __init__(self, service_uuids: list[str]):
+        self.service_uuids = service_uuids
+
+
+class FakeCharacteristic:
+    def __init__(self, uuid: str, handle: int):
+        self.uuid = uuid
+        self.handle = handle
+
+
+class FakeServices:
+    def __init__(self, characteristic: FakeCharacteristic):
+        self.characteristic = characteristic
+
+    def get_characteristic(self, specifier: int | str):
+        if specifier in (self.characteristic.handle, self.characteristic.uuid):
+            return self.characteristic
+        return None
+
+
+class FakeBackend:
+    """
+    Scripted stand-in for bleak, to run BLESubscriber without a Bluetooth adapter.
+
+    Pass `backend.scanner` and `backend.client_class` to BLESubscriber. Each
+    entry of `sessions` is a list of CSV notifications sent on one connection,
+    after which the link drops. The connection after the last session stays up
+    silently. With `direct_connect=False`, connecting by address fails, like a
+    device that changed address, and only a scan will find it.
+    """
+
+    def __init__(self, sessions: list[list[str]], address: str = "AA:BB:CC:DD:EE:FF",
+                 direct_connect: bool = True, interval: float = 0.001):
+        self.sessions = list(sessions)
+        self.device = FakeDevice(address)
+        self.direct_connect = direct_connect
+        self.interval = interval
+        self.characteristic = FakeCharacteristic(CHARACTERISTIC_UUID, 42)
+        self.calls: list[str] = []
+        self.timeouts: list[float] = []
+        self.scanner = self
+
+    async def find_device_by_filter(self, filterfunc, timeout: float = 10.0):
+        self.calls.append("scan")
+        advertisement = FakeAdvertisementData([SERVICE_UUID])
+        return self.device if filterfunc(self.device, advertisement) else None
+
+    def client_class(self, address_or_ble_device, disconnected_callback=None,
+                     timeout: float = 10.0, **kwargs):
+        self.timeouts.append(timeout)
+        return FakeClient(self, address_or_ble_device, disconnected_callback)
+
+
+class FakeClient:
+    def __init__(self, backend: FakeBackend, address_or_ble_device, disconnected_callback):
+        self.backend = backend
+        self.by_address = isinstance(address_or_ble_device, str)
+        self.address = backend.device.address
+        self.disconnected_callback = disconnected_callback
+        self.services = FakeServices(backend.characteristic)
+        self.is_connected = False
+        self._feeder: asyncio.Task | None = None
+
+    async def connect(self):
+        self.backend.calls.append("connect_address" if self.by_address else "connect_device")
+        if self.by_address and not self.backend.direct_connect:
+            raise BleakError(f"Device with address {self.address} was not found")
+        self.is_connected = True
+
+    async def start_notify(self, characteristic, callback):
+        script = self.backend.sessions.pop(0) if self.backend.sessions else None
+        self._feeder = asyncio.create_task(self._feed(script, callback))
+
+    async def _feed(self, script: list[str] | None, callback):
+        for line in script or []:
+            await asyncio.sleep(self.backend.interval)
+            callback(self.backend.characteristic, bytearray(line.encode()))
+        if script is not None:
+            self.is_connected = False
+            self.disconnected_callback(self)
+
+    async def disconnect(self):
+        if self._feeder:
+            self._feeder.cancel()
+        self.is_connected = False
@@ -0,0 +1,96 @@
+import asyncio
+import json
+import logging
+import pathlib
+import tempfile
+
+from ble_subscriber import BLESubscriber
+from fake_bleak import FakeBackend
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def take(subscriber: BLESubscriber, count: int):
+    events = []
+    async for event in subscriber:
+        events.append(event)
+        if len(events) == count:
+            break
+    return events
+
+
+async def check_reconnect():
+    """Link drops after each session, the subscriber reconnects to the same address."""
+    backend = FakeBackend([
+        ["b,BUTTON,PRESS", "garbage", "j,JOYSTICK,0.5,-0.25"],
+        ["s,SLIDER,0.7", "d,DPAD,LEFT,CLICK"],
+    ])
+    async with BLESubscriber(cache_file=None, backoff=(0.01, 0.04), scanner=backend.scanner,
+                             client_class=backend.client_class) as subscriber:
+        events = await take(subscriber, 4)
+
+    assert events == [
+        {"id": "b", "type": "BUTTON", "state": "PRESS"},
+        {"id": "j", "type": "JOYSTICK", "x": 0.5, "y": -0.25},
+        {"id": "s", "type": "SLIDER", "value": 0.7},
+        {"id": "d", "type": "DPAD", "button": "LEFT", "state": "CLICK"},
+    ], events
+    assert backend.calls == ["scan", "connect_device", "connect_address"], backend.calls
+    assert subscriber.malformed == 1
+    assert [phase for (phase, _) in subscriber.first_event_times] == ["startup", "reconnect"]
+
+
+async def check_scan_fallback():
+    """The cached address is tried briefly first, a scan finds the device under a new one."""
+    backend = FakeBackend([["w,SWITCH,true"]], direct_connect=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = pathlib.Path(tmp) / "cache.json"
+        cache_file.write_text(json.dumps({"address": "11:22:33:44:55:66", "handle": 42}))
+        async with BLESubscriber(cache_file=cache_file, direct_timeout=1.5, scanner=backend.scanner,
+                                 client_class=backend.client_class) as subscriber:
+            events = await take(subscriber, 1)
+        cache = json.loads(cache_file.read_text())
+
+    assert events == [{"id": "w", "type": "SWITCH", "state": True}], events
+    assert backend.calls[:3] == ["connect_address", "scan", "connect_device"], backend.calls
+    assert backend.timeouts[:2] == [1.5, subscriber.connect_timeout], backend.timeouts
+    assert cache["address"] == backend.device.address, cache
+
+
+async def check_bounded_queue():
+    """A slow consumer only sees the newest events, the rest are counted as dropped."""
+    backend = FakeBackend([[f"v,SLIDER,{i / 10}" for i in range(10)]])
+    async with BLESubscriber(cache_file=None, queue_size=2, scanner=backend.scanner,
+                             client_class=backend.client_class) as subscriber:
+        await asyncio.sleep(0.1)  # let the whole session arrive unread
+        events = await take(subscriber, 2)
+
+    assert [event["value"] for event in events] == [0.8, 0.9], events
+    assert subscriber.dropped == 8, subscriber.dropped
+
+
+async def check_stop_not_dropped():
+    """Stopping with a full queue makes room for the end marker without counting a drop."""
+    backend = FakeBackend([["b,BUTTON,PRESS", "b,BUTTON,RELEASE"]])
+    async with BLESubscriber(cache_file=None, queue_size=2, scanner=backend.scanner,
+                             client_class=backend.client_class) as subscriber:
+        await asyncio.sleep(0.1)  # let the queue fill up unread
+
+    assert subscriber.dropped == 0, subscriber.dropped
+
+
+async def run_checks():
+    for check in (check_reconnect, check_scan_fallback, check_bounded_queue,
+                  check_stop_not_dropped):
+        await check()
+        logger.info(f"{check.__name__}: OK")
+
+
+def main():
+    """Run BLESubscriber against the scripted fake backend."""
+    asyncio.run(run_checks())
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ import base64
 import zlib
 import ipaddress
 import pathlib
+import urllib.parse
 
 
 def qr_encode(obj: dict):
@@ -51,6 +52,7 @@ def create_servers(config, config_file):
         pad_config["format_map"] = pad_config.get("format_map", True)
         pad_config["default_eval"] = pad_config.get("default_eval", "sh").lower()
         pad_config["call_sync"] = pad_config.get("call_sync", "threaded_async").lower()
+        pad_config["forward"] = pad_config.get("forward", [])
 
         if not isinstance(pad_port, int):
             print(f"[Error] Port in pad '{pad}' is not a integer.")
@@ -79,6 +81,11 @@ def create_servers(config, config_file):
             print(f"[Error] 'call_sync' in pad '{pad}' should be one of {repr(choices)}")
             continue
 
+        if not isinstance(pad_config["forward"], list) or not all(
+                isinstance(t, str) for t in pad_config["forward"]):
+            print(f"[Error] 'forward' in pad '{pad}' is not a list of strings.")
+            continue
+
         server_address = (pad_host, pad_port)
         match pad_type:
             case "TCP":
@@ -95,6 +102,7 @@ def create_servers(config, config_file):
         # Start server thread
         server = ServerClass(server_address, RequestHandlerClass)
         server.setup_rules(pad_rules, pad_config)
+        server.setup_forward(pad_config["forward"])
         if pad_config.get("display_qr"):
             server.display_qr(pad_config, config_file)
         server_thread = threading.Thread(target=server.serve_forever)
@@ -155,6 +163,94 @@ class RulesMixIn(socketserver.BaseServer):
                       key}': {type(value).__name__}")
                 continue
 
+    def setup_forward(self, targets: list[str]):
+        # sockets are created once here and reused for every payload
+        # UDP sockets are connected, so their address is None and an absent
+        # receiver surfaces as ConnectionRefusedError on the next send
+        self.forward_targets: list[tuple[str, socket.socket, str | None]] = []
+        self.forward_drops: dict[str, int] = {}
+        self.forward_lock = threading.Lock()
+
+        for target in targets:
+            url = urllib.parse.urlsplit(target)
+            sock = None
+            try:
+                match url.scheme.lower():
+                    case "udp" | "multicast":
+                        if not url.hostname or not url.port:
+                            print(f"[Error] forward target '{
+                                  target}' needs a host and a port.")
+                            continue
+                        # resolve once, so sending never does a DNS lookup
+                        info = socket.getaddrinfo(
+                            url.hostname, url.port, type=socket.SOCK_DGRAM)[0]
+                        address = info[4]
+                        sock = socket.socket(info[0], socket.SOCK_DGRAM)
+                        if ipaddress.ip_address(address[0]).is_multicast:
+                            # keep multicast traffic on the local network segment
+                            if info[0] == socket.AF_INET6:
+                                sock.setsockopt(socket.IPPROTO_IPV6,
+                                                socket.IPV6_MULTICAST_HOPS, 1)
+                            else:
+                                sock.setsockopt(socket.IPPROTO_IP,
+                                                socket.IP_MULTICAST_TTL, 1)
+                        elif url.scheme.lower() == "multicast":
+                            print(f"[Error] forward target '{
+                                  target}' is not a multicast address.")
+                            sock.close()
+                            continue
+                        sock.connect(address)
+                        address = None
+                    case "unix":
+                        if not hasattr(socket, "AF_UNIX"):
+                            print(f"[Error] forward target '{
+                                  target}' needs Unix sockets, unsupported here.")
+                            continue
+                        address = url.netloc + url.path
+                        if not address:
+                            print(f"[Error] forward target '{target}' needs a path.")
+                            continue
+                        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+                    case _scheme:
+                        print(f"[Error] forward target '{target}' has invalid scheme '{
+                              _scheme}', only 'udp', 'multicast' and 'unix' supported")
+                        continue
+            except ValueError as e:
+                # invalid or out of range port
+                print(f"[Error] forward target '{target}' is not well formed: {e}")
+                if sock:
+                    sock.close()
+                continue
+            except OSError as e:
+                print(f"[Error] forward target '{target}' could not be created: {e}")
+                if sock:
+                    sock.close()
+                continue
+
+            sock.setblocking(False)
+            self.forward_targets.append((target, sock, address))
+            self.forward_drops[target] = 0
+
+    def forward(self, payload: bytes):
+        for (target, sock, address) in self.forward_targets:
+            try:
+                if address is None:
+                    sock.send(payload)
+                else:
+                    sock.sendto(payload, address)
+            except OSError:
+                # target is absent or its socket buffer is full, count and move on
+                with self.forward_lock:
+                    self.forward_drops[target] += 1
+                    drops = self.forward_drops[target]
+                if drops & (drops - 1) == 0:  # warn at every power of two
+                    print(f"[Warning] {drops} payloads dropped forwarding to '{target}'")
+
+    def server_close(self):
+        for (_, sock, _) in getattr(self, "forward_targets", []):
+            sock.close()
+        super().server_close()
+
     def display_qr(self, pad_config: dict, config_file: str):
         template_path = pathlib.Path(config_file)\
             .with_name(pad_config["name"]).with_suffix(".json")
@@ -404,6 +500,7 @@ class RulesMixIn(socketserver.BaseServer):
 
 class UDPHandler(socketserver.BaseRequestHandler):
     def handle(self):
+        self.server.__getattribute__("forward")(self.request[0])
         self.server.__getattribute__("on_event")(
             json.loads(self.request[0].strip()))
 
@@ -421,6 +518,7 @@ class TCPHandler(socketserver.BaseRequestHandler):
 
             while -1 != (pos := data.find(b'}')):
                 event, data = (data[:pos+1], data[pos+1:])
+                self.server.__getattribute__("forward")(event)
                 self.server.__getattribute__("on_event")(json.loads(event))
 
 